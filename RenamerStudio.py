@@ -1,6 +1,10 @@
+import json
 import os
+import queue
 import sys
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor, wait
 from tkinter import filedialog, messagebox, simpledialog, ttk
 import customtkinter as ctk  # pip install customtkinter pandas openpyxl
 import pandas as pd
@@ -34,6 +38,390 @@ FONTS = {
 RADIUS = 10
 
 
+# --- SHARED RENAME HELPERS ---
+def guess_columns(cols):
+    """Best guess for the Folder / Filename / New Name / ISRC columns of a sheet."""
+
+    def first(match):
+        for c in cols:
+            if match(str(c).lower()):
+                return c
+        return "-- Select --"
+
+    return {
+        "folder": first(lambda c: "folder" in c),
+        "file": first(lambda c: "file" in c and "name" in c),
+        "new": first(
+            lambda c: "english track name" in c
+            or "new track" in c
+            or "english name" in c
+        ),
+        "isrc": first(lambda c: "isrc" in c),
+    }
+
+
+def read_sheet(file_path, header_row):
+    h_row = max(header_row - 1, 0)
+    if file_path.endswith(".csv"):
+        return pd.read_csv(file_path, header=h_row)
+    return pd.read_excel(file_path, header=h_row)
+
+
+def find_source(root, fol, target, strict, listings=None):
+    """Look for `target` in root/fol first, then root. Returns (path, parent).
+
+    In strict mode an optional ListingCache saves listing a folder per row.
+    """
+    for p in [os.path.join(root, fol), root]:
+        if not os.path.exists(p):
+            continue
+        if strict:
+            if listings is not None:
+                hit = listings.contains(p, target)
+            else:
+                hit = target in os.listdir(p)
+            if hit:
+                return os.path.join(p, target), p
+        else:
+            cand = os.path.join(p, target)
+            if os.path.exists(cand):
+                return cand, p
+    return None, None
+
+
+def build_final_name(name, ext, eng, isrc):
+    base = f"_{name}" if (eng == "nan" or not eng) else eng
+    return f"{base}_{isrc}{ext}" if isrc else f"{base}{ext}"
+
+
+def rename_file(src, dst):
+    # Case-only renames need a hop on case-insensitive file systems
+    if src.lower() == dst.lower():
+        os.rename(src, src + "_tmp")
+        os.rename(src + "_tmp", dst)
+    else:
+        os.rename(src, dst)
+
+
+def volume_key(path):
+    """Identify the disk a path lives on (drive letter / UNC share, else device id)."""
+    path = os.path.abspath(path)
+    drive = os.path.splitdrive(path)[0]
+    if drive:
+        return drive.upper()
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return path
+
+
+def apply_util_rules(name, i, rules):
+    """Quick Utility rename of one file. Returns (new name, status)."""
+    r, ext = os.path.splitext(name)
+    new_r = r.replace(rules["find"], rules["replace"]) if rules["find"] else r
+    if rules["case"] == "UPPERCASE":
+        new_r = new_r.upper()
+    elif rules["case"] == "lowercase":
+        new_r = new_r.lower()
+    elif rules["case"] == "Title Case":
+        new_r = new_r.title()
+
+    new_r = f"{rules['prefix']}{new_r}{rules['suffix']}"
+    if rules["numbering"]:
+        new_r += f"_{str(i+1).zfill(3)}"
+
+    final = new_r + ext
+    return final, "Ready" if final != name else "No Change"
+
+
+# --- PROJECT FILES ---
+PROJECT_VERSION = 1
+
+
+def dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def file_signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+class ListingCache:
+    """Folder listings for Strict Case lookups, kept across runs and projects.
+
+    Strict matching needs the exact names in a folder, which otherwise means
+    an os.listdir per row. Each listing is stored with the folder's mtime.
+    Listings not read from disk during the current run are double-checked:
+    a hit is confirmed with os.path.exists and a miss re-lists the folder,
+    so a coarse or stale mtime costs a re-list but never skips a file.
+    """
+
+    def __init__(self, dirs=None):
+        self.dirs = dirs or {}  # folder -> (mtime_ns, set of names)
+        self.fresh = set()  # folders listed from disk during this run
+
+    def begin_run(self):
+        self.fresh = set()
+
+    def _load(self, path):
+        mtime = dir_mtime(path)
+        names = set(os.listdir(path))
+        self.dirs[path] = (mtime, names)
+        self.fresh.add(path)
+        return names
+
+    def contains(self, path, name):
+        entry = self.dirs.get(path)
+        if path in self.fresh:
+            return name in entry[1]
+        if entry is None or entry[0] != dir_mtime(path):
+            return name in self._load(path)
+        if name in entry[1] and os.path.exists(os.path.join(path, name)):
+            return True
+        return name in self._load(path)
+
+    def renamed(self, path, old, new):
+        entry = self.dirs.get(path)
+        if entry is None:
+            return
+        names = entry[1]
+        names.discard(old)
+        names.add(new)
+        # Our own rename bumps the mtime; record it so the listing stays valid
+        self.dirs[path] = (dir_mtime(path), names)
+
+    def to_json(self):
+        return {p: [m, sorted(names)] for p, (m, names) in self.dirs.items()}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls({p: (e[0], set(e[1])) for p, e in data.items()})
+
+
+# --- BATCH QUEUE ---
+MANIFEST_KEYS = {
+    "excel": "",
+    "root": "",
+    "header_row": 2,
+    "folder_col": "",
+    "file_col": "",
+    "new_col": "",
+    "isrc_col": "",
+    "enable_isrc": False,
+    "strict_case": False,
+}
+
+
+def make_job(entry):
+    """Fill a manifest entry with defaults. Blank columns are auto-detected later."""
+    job = dict(MANIFEST_KEYS)
+    for k, v in entry.items():
+        if k in job and not (isinstance(v, float) and pd.isna(v)):
+            job[k] = v
+    if not job["excel"] or not job["root"]:
+        raise ValueError(f"Manifest entry needs 'excel' and 'root': {entry}")
+    job["header_row"] = int(job["header_row"])
+    for k in ("enable_isrc", "strict_case"):
+        if isinstance(job[k], str):
+            job[k] = job[k].strip().lower() in ("1", "true", "yes", "y")
+        else:
+            job[k] = bool(job[k])
+    for k in ("folder_col", "file_col", "new_col", "isrc_col"):
+        job[k] = str(job[k]).strip() if job[k] else ""
+    return job
+
+
+def load_manifest(path):
+    """Read jobs from a JSON list of objects or a CSV with one job per row."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as fh:
+            entries = json.load(fh)
+        if isinstance(entries, dict):
+            entries = entries.get("jobs", [])
+    else:
+        entries = pd.read_csv(path).to_dict("records")
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    for entry in entries:
+        job = make_job(entry)
+        # Relative paths in a manifest are relative to the manifest itself
+        job["excel"] = os.path.join(base, job["excel"])
+        job["root"] = os.path.join(base, job["root"])
+        jobs.append(job)
+    return jobs
+
+
+def plan_job(job):
+    """Resolve every sheet row of a job to a (source, destination) pair.
+
+    Only reads the disk. Rows whose file can't be found, or whose ISRC is
+    missing while ISRC is enabled, are counted as skipped (no popups in batch).
+    Rows that raise while being resolved are counted as errors.
+    Returns (moves, skipped, errors).
+    """
+    df = read_sheet(job["excel"], job["header_row"])
+    guess = guess_columns(list(df.columns))
+    c_fol = job["folder_col"] or guess["folder"]
+    c_fil = job["file_col"] or guess["file"]
+    c_new = job["new_col"] or guess["new"]
+    c_isrc = job["isrc_col"] or guess["isrc"]
+
+    for c in (c_fol, c_fil, c_new):
+        if c not in df.columns:
+            raise ValueError(f"Column not found: {c}")
+    if job["enable_isrc"] and c_isrc not in df.columns:
+        raise ValueError("Smart ISRC is on but no ISRC column was found")
+
+    moves, skipped, errors = [], 0, 0
+    for _, row in df.iterrows():
+        try:
+            fol = str(row[c_fol]).strip()
+            fil = str(row[c_fil]).strip()
+            eng = str(row[c_new]).strip()
+            if fol == "nan" or fil == "nan":
+                skipped += 1
+                continue
+
+            name, ext = os.path.splitext(fil)
+            if not ext:
+                ext = ".wav"
+            found_p, parent = find_source(
+                job["root"], fol, name + ext, job["strict_case"]
+            )
+            if not found_p:
+                skipped += 1
+                continue
+
+            isrc = ""
+            if job["enable_isrc"]:
+                if pd.notna(row[c_isrc]):
+                    isrc = str(row[c_isrc]).strip()
+                if not isrc:
+                    skipped += 1
+                    continue
+
+            new_full = os.path.join(parent, build_final_name(name, ext, eng, isrc))
+            if found_p != new_full:
+                moves.append((found_p, new_full))
+        except Exception:
+            errors += 1
+    return moves, skipped, errors
+
+
+class BatchQueue:
+    """Runs many sheet/root jobs: plans them in parallel, then renames with
+    at most `per_volume` jobs writing to the same disk at once.
+
+    Meant to run on a worker thread; the UI polls `results`, `done`/`total`
+    and drains `messages`.
+    """
+
+    def __init__(self, jobs, per_volume=1, plan_workers=8):
+        self.jobs = jobs
+        self.per_volume = max(1, per_volume)
+        self.plan_workers = max(1, plan_workers)
+        self.results = [
+            {"status": "Queued", "renamed": 0, "skipped": 0, "errors": 0}
+            for _ in jobs
+        ]
+        self.messages = queue.Queue()
+        self.total = 0
+        self.done = 0
+        self.finished = False
+        self._lock = threading.Lock()
+        self._plans = [[] for _ in jobs]
+
+    def run(self):
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(self.plan_workers, len(self.jobs)) or 1
+            ) as pool:
+                list(pool.map(self._plan, range(len(self.jobs))))
+            self._drop_conflicts()
+            self.total = sum(len(p) for p in self._plans)
+            self.messages.put(f"Planned {self.total} renames across {len(self.jobs)} jobs.")
+
+            # One executor per disk: jobs on different disks overlap,
+            # jobs on the same disk never exceed the cap.
+            by_volume = {}
+            for i, job in enumerate(self.jobs):
+                by_volume.setdefault(volume_key(job["root"]), []).append(i)
+            pools = [
+                ThreadPoolExecutor(max_workers=self.per_volume) for _ in by_volume
+            ]
+            futures = [
+                pool.submit(self._execute, i)
+                for pool, indexes in zip(pools, by_volume.values())
+                for i in indexes
+            ]
+            wait(futures)
+            for pool in pools:
+                pool.shutdown()
+        finally:
+            self.finished = True
+        return self.results
+
+    def _plan(self, index):
+        job, res = self.jobs[index], self.results[index]
+        res["status"] = "Planning"
+        try:
+            self._plans[index], res["skipped"], res["errors"] = plan_job(job)
+            if res["errors"]:
+                self.messages.put(
+                    f"[Job {index+1}] {res['errors']} rows could not be resolved."
+                )
+            res["status"] = "Planned"
+        except Exception as e:
+            res["status"] = "Failed"
+            self.messages.put(f"[Job {index+1}] {os.path.basename(job['excel'])}: {e}")
+
+    def _drop_conflicts(self):
+        # Renames run concurrently, so two moves sharing a source or a
+        # destination (in one job or across jobs) could clobber each other.
+        srcs, dsts = {}, {}
+        for moves in self._plans:
+            for src, dst in moves:
+                srcs[src.lower()] = srcs.get(src.lower(), 0) + 1
+                dsts[dst.lower()] = dsts.get(dst.lower(), 0) + 1
+        for index, moves in enumerate(self._plans):
+            keep = []
+            for src, dst in moves:
+                if srcs[src.lower()] > 1 or dsts[dst.lower()] > 1:
+                    self.results[index]["errors"] += 1
+                    self.messages.put(
+                        f"[Job {index+1}] Conflict, not renamed: "
+                        f"{os.path.basename(src)} -> {os.path.basename(dst)}"
+                    )
+                else:
+                    keep.append((src, dst))
+            self._plans[index] = keep
+
+    def _execute(self, index):
+        res = self.results[index]
+        if res["status"] == "Failed":
+            return
+        res["status"] = "Renaming"
+        for src, dst in self._plans[index]:
+            try:
+                # Guard against files created outside the queue since planning
+                if os.path.exists(dst) and not (
+                    src.lower() == dst.lower() and os.path.samefile(src, dst)
+                ):
+                    raise FileExistsError(f"Destination exists: {dst}")
+                rename_file(src, dst)
+                res["renamed"] += 1
+            except OSError as e:
+                res["errors"] += 1
+                self.messages.put(f"[Job {index+1}] Err {os.path.basename(src)}: {e}")
+            with self._lock:
+                self.done += 1
+        res["status"] = "Done" if not res["errors"] else "Done (errors)"
+
+
 class RenamerApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -46,6 +434,15 @@ class RenamerApp(ctk.CTk):
         # Data
         self.df = None
         self.manual_overrides = {}
+        self.column_mapping = {}
+        self.batch_jobs = []
+        self.batch = None
+        self.batch_reported = False
+        self.batch_poll_id = None
+
+        self.df_header_row = None
+        self.df_path = None
+        self.listings = ListingCache()
 
         # Vars
         self.excel_path = ctk.StringVar()
@@ -63,6 +460,8 @@ class RenamerApp(ctk.CTk):
         self.util_case = ctk.StringVar(value="No Change")
         self.util_num_enable = ctk.BooleanVar(value=False)
 
+        self.var_jobs_per_disk = ctk.IntVar(value=1)
+
         # Layout
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -104,7 +503,7 @@ class RenamerApp(ctk.CTk):
             self, width=280, corner_radius=0, fg_color=THEME["bg"]
         )
         self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_rowconfigure(4, weight=1)
+        self.sidebar.grid_rowconfigure(5, weight=1)
 
         # Branding
         ctk.CTkLabel(
@@ -123,6 +522,11 @@ class RenamerApp(ctk.CTk):
         # Nav Buttons
         self.btn_excel = self.create_nav_btn("📊 Smart Rename", self.show_excel_view, 2)
         self.btn_util = self.create_nav_btn("🛠 Quick Utility", self.show_util_view, 3)
+        self.btn_batch = self.create_nav_btn("📦 Batch Queue", self.show_batch_view, 4)
+
+        # Project Buttons (pinned to the bottom)
+        self.create_nav_btn("💾 Save Project", self.save_project, 6)
+        self.create_nav_btn("📁 Open Project", self.open_project, 7)
 
     def create_nav_btn(self, text, command, row):
         btn = ctk.CTkButton(
@@ -160,9 +564,16 @@ class RenamerApp(ctk.CTk):
     def set_active_nav(self, active_btn):
         self.btn_excel.configure(fg_color="transparent", text_color=THEME["text_dim"])
         self.btn_util.configure(fg_color="transparent", text_color=THEME["text_dim"])
+        self.btn_batch.configure(fg_color="transparent", text_color=THEME["text_dim"])
         active_btn.configure(fg_color=THEME["surface"], text_color=THEME["primary"])
 
     def clear_content(self):
+        # Keep the Smart Rename column choices when leaving that view
+        if getattr(self, "combo_folder", None) is not None:
+            # Combos without a sheet only hold a placeholder; keep the old mapping
+            if self.df is not None:
+                self.column_mapping = self.get_column_mapping()
+            self.combo_folder = None
         for widget in self.content.winfo_children():
             widget.destroy()
 
@@ -234,6 +645,9 @@ class RenamerApp(ctk.CTk):
         )
         self.create_toggle(row_tog, "🔒 Strict Case Match", self.var_strict_case)
 
+        if self.df is not None:
+            self.apply_column_mapping(self.column_mapping)
+
         self.create_action_btn("▶ Start Renaming", self.run_excel)
 
         # Log
@@ -329,6 +743,107 @@ class RenamerApp(ctk.CTk):
 
         self.create_action_btn("✓ Apply Changes", self.run_util)
 
+        if self.util_folder_path.get():
+            self.update_preview()
+
+    # ================= BATCH VIEW =================
+    def show_batch_view(self):
+        self.set_active_nav(self.btn_batch)
+        self.clear_content()
+        self.header_label.configure(text="Batch Queue")
+
+        card_q = self.create_card("Job Queue")
+
+        row_btn = ctk.CTkFrame(card_q, fg_color="transparent")
+        row_btn.pack(fill="x", pady=(0, 15))
+        for text, cmd in [
+            ("📄 Load Manifest", self.browse_manifest),
+            ("＋ Add Smart Rename Setup", self.add_current_job),
+            ("✕ Clear", self.clear_batch),
+        ]:
+            ctk.CTkButton(
+                row_btn,
+                text=text,
+                command=cmd,
+                height=42,
+                fg_color=THEME["surface_hover"],
+                hover_color="gray",
+                text_color="white",
+                border_width=1,
+                border_color=THEME["outline"],
+                corner_radius=RADIUS,
+                font=FONTS["body"],
+            ).pack(side="left", padx=(0, 10))
+
+        ctk.CTkLabel(
+            row_btn,
+            text="Jobs per disk:",
+            text_color=THEME["text_main"],
+            font=FONTS["label"],
+        ).pack(side="left", padx=(20, 10))
+        ctk.CTkEntry(
+            row_btn,
+            textvariable=self.var_jobs_per_disk,
+            width=60,
+            font=FONTS["mono"],
+            fg_color=THEME["surface_hover"],
+            text_color="white",
+            border_width=1,
+            border_color=THEME["outline"],
+        ).pack(side="left")
+
+        tree_frame = ctk.CTkFrame(
+            self.content,
+            fg_color=THEME["surface"],
+            corner_radius=RADIUS,
+            border_width=1,
+            border_color=THEME["outline"],
+        )
+        tree_frame.pack(fill="both", expand=True, padx=20, pady=5)
+
+        self.batch_tree = ttk.Treeview(
+            tree_frame, columns=("X", "R", "S", "D"), show="headings", height=6
+        )
+        self.batch_tree.heading("X", text="Spreadsheet")
+        self.batch_tree.column("X", width=300)
+        self.batch_tree.heading("R", text="Root Folder")
+        self.batch_tree.column("R", width=350)
+        self.batch_tree.heading("S", text="Status")
+        self.batch_tree.column("S", width=120)
+        self.batch_tree.heading("D", text="Renamed / Skipped / Errors")
+        self.batch_tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+        row_prog = ctk.CTkFrame(self.content, fg_color="transparent")
+        row_prog.pack(fill="x", padx=20, pady=(15, 0))
+        self.batch_progress = ctk.CTkProgressBar(
+            row_prog, progress_color=THEME["primary"], height=12
+        )
+        self.batch_progress.pack(side="left", fill="x", expand=True)
+        self.batch_progress.set(0)
+        self.batch_progress_label = ctk.CTkLabel(
+            row_prog, text="", text_color=THEME["text_dim"], font=FONTS["label"]
+        )
+        self.batch_progress_label.pack(side="left", padx=15)
+
+        self.create_action_btn("▶ Run Queue", self.run_batch)
+
+        self.log_box = ctk.CTkTextbox(
+            self.content,
+            height=120,
+            fg_color=THEME["surface"],
+            text_color="white",
+            font=FONTS["mono"],
+            corner_radius=RADIUS,
+            border_width=1,
+            border_color=THEME["outline"],
+        )
+        self.log_box.pack(fill="x", padx=20, pady=(0, 20))
+        self.log_box.configure(state="disabled")
+
+        self.refresh_batch_tree()
+        if self.batch is not None:
+            self.schedule_batch_poll(self.batch, 0)
+
     # --- HELPERS ---
     def create_card(self, title):
         card = ctk.CTkFrame(
@@ -490,58 +1005,37 @@ class RenamerApp(ctk.CTk):
             h_row = 1
 
         try:
-            if file_path.endswith(".csv"):
-                self.df = pd.read_csv(file_path, header=h_row)
-            else:
-                self.df = pd.read_excel(file_path, header=h_row)
-
-            cols = ["-- Select --"] + list(self.df.columns)
-            for c in [
-                self.combo_folder,
-                self.combo_file,
-                self.combo_eng,
-                self.combo_isrc,
-            ]:
-                c.configure(values=cols)
-                c.set(cols[0])
+            self.df = read_sheet(file_path, h_row + 1)
+            self.df_header_row = h_row + 1
+            self.df_path = file_path
 
             # --- IMPROVED AUTO-SELECT LOGIC ---
-            if len(cols) > 1:
-                # 1. Folder
-                guesses = [c for c in cols if "folder" in str(c).lower()]
-                if guesses:
-                    self.combo_folder.set(guesses[0])
-
-                # 2. Filename
-                guesses = [
-                    c
-                    for c in cols
-                    if "file" in str(c).lower() and "name" in str(c).lower()
-                ]
-                if guesses:
-                    self.combo_file.set(guesses[0])
-
-                # 3. New Name (English Track Name)
-                guesses = [
-                    c
-                    for c in cols
-                    if "english track name" in str(c).lower()
-                    or "new track" in str(c).lower()
-                    or "english name" in str(c).lower()
-                ]
-                if guesses:
-                    self.combo_eng.set(guesses[0])
-
-                # 4. ISRC (ISRC Code)
-                guesses = [c for c in cols if "isrc" in str(c).lower()]
-                if guesses:
-                    self.combo_isrc.set(guesses[0])
+            self.apply_column_mapping(guess_columns(list(self.df.columns)))
 
             self.log(f"Loaded {len(self.df)} rows (Header: {h_row+1}).")
 
         except Exception as e:
             messagebox.showerror("Error", f"Could not read Excel file.\n{e}")
 
+    def get_column_mapping(self):
+        return {
+            "folder": self.combo_folder.get(),
+            "file": self.combo_file.get(),
+            "new": self.combo_eng.get(),
+            "isrc": self.combo_isrc.get(),
+        }
+
+    def apply_column_mapping(self, mapping):
+        cols = ["-- Select --"] + list(self.df.columns)
+        for key, c in [
+            ("folder", self.combo_folder),
+            ("file", self.combo_file),
+            ("new", self.combo_eng),
+            ("isrc", self.combo_isrc),
+        ]:
+            c.configure(values=cols)
+            c.set(mapping.get(key) if mapping.get(key) in cols else cols[0])
+
     def run_excel(self):
         root = self.root_folder_path.get()
         if self.df is None:
@@ -553,6 +1047,7 @@ class RenamerApp(ctk.CTk):
 
         self.log("Starting batch rename...")
         count = 0
+        self.listings.begin_run()
 
         for i, row in self.df.iterrows():
             try:
@@ -567,20 +1062,7 @@ class RenamerApp(ctk.CTk):
                     ext = ".wav"
                 target = name + ext
 
-                found_p, parent = None, None
-                paths = [os.path.join(root, fol), root]
-                for p in paths:
-                    if not os.path.exists(p):
-                        continue
-                    if strict:
-                        if target in os.listdir(p):
-                            found_p, parent = os.path.join(p, target), p
-                            break
-                    else:
-                        cand = os.path.join(p, target)
-                        if os.path.exists(cand):
-                            found_p, parent = cand, p
-                            break
+                found_p, parent = find_source(root, fol, target, strict, self.listings)
 
                 if not found_p:
                     continue
@@ -595,22 +1077,160 @@ class RenamerApp(ctk.CTk):
                         )
                         isrc = val.strip() if val else ""
 
-                base = f"_{name}" if (eng == "nan" or not eng) else eng
-                final = f"{base}_{isrc}{ext}" if isrc else f"{base}{ext}"
+                final = build_final_name(name, ext, eng, isrc)
 
                 new_full = os.path.join(parent, final)
                 if found_p != new_full:
-                    if found_p.lower() == new_full.lower():
-                        os.rename(found_p, found_p + "_tmp")
-                        os.rename(found_p + "_tmp", new_full)
-                    else:
-                        os.rename(found_p, new_full)
+                    rename_file(found_p, new_full)
+                    self.listings.renamed(parent, target, final)
                     self.log(f"Renamed: {target} -> {final}")
                     count += 1
             except Exception as e:
                 self.log(f"Err Row {i}: {e}")
         messagebox.showinfo("Done", f"Processed {count} files.")
 
+    # --- BATCH LOGIC ---
+    def browse_manifest(self):
+        if self.batch is not None and not self.batch.finished:
+            return
+        f = filedialog.askopenfilename(
+            filetypes=[("Manifest", "*.json *.csv"), ("All", "*.*")]
+        )
+        if not f:
+            return
+        try:
+            jobs = load_manifest(f)
+        except Exception as e:
+            return messagebox.showerror("Error", f"Could not read manifest.\n{e}")
+        self.batch_jobs.extend(jobs)
+        self.batch = None
+        self.refresh_batch_tree()
+        self.log(f"Queued {len(jobs)} jobs from {os.path.basename(f)}.")
+
+    def add_current_job(self):
+        if self.batch is not None and not self.batch.finished:
+            return
+        if not self.excel_path.get() or not self.root_folder_path.get():
+            return messagebox.showerror(
+                "Error", "Set an Excel Database and Music Folder in Smart Rename first."
+            )
+        excel = self.excel_path.get()
+        # The mapping only belongs to this sheet if it was loaded from this path;
+        # otherwise leave the columns blank so the job auto-detects them.
+        cols = {}
+        if self.df is not None and self.df_path == excel:
+            header_row = self.df_header_row
+            cols = {
+                k: ("" if v == "-- Select --" else v)
+                for k, v in self.current_column_mapping().items()
+            }
+        else:
+            try:
+                header_row = self.var_header_row.get()
+            except:
+                header_row = 2
+        self.batch_jobs.append(
+            make_job(
+                {
+                    "excel": excel,
+                    "root": self.root_folder_path.get(),
+                    "header_row": header_row,
+                    "folder_col": cols.get("folder", ""),
+                    "file_col": cols.get("file", ""),
+                    "new_col": cols.get("new", ""),
+                    "isrc_col": cols.get("isrc", ""),
+                    "enable_isrc": self.var_enable_isrc.get(),
+                    "strict_case": self.var_strict_case.get(),
+                }
+            )
+        )
+        self.batch = None
+        self.refresh_batch_tree()
+
+    def clear_batch(self):
+        if self.batch is not None and not self.batch.finished:
+            return
+        self.batch_jobs = []
+        self.batch = None
+        self.refresh_batch_tree()
+        self.batch_progress.set(0)
+        self.batch_progress_label.configure(text="")
+
+    def refresh_batch_tree(self):
+        for i in self.batch_tree.get_children():
+            self.batch_tree.delete(i)
+        for i, job in enumerate(self.batch_jobs):
+            if self.batch is not None:
+                res = self.batch.results[i]
+                status = res["status"]
+                counts = f"{res['renamed']} / {res['skipped']} / {res['errors']}"
+            else:
+                status, counts = "Queued", ""
+            self.batch_tree.insert(
+                "",
+                "end",
+                iid=str(i),
+                values=(os.path.basename(job["excel"]), job["root"], status, counts),
+            )
+
+    def run_batch(self):
+        if self.batch is not None and not self.batch.finished:
+            return
+        if not self.batch_jobs:
+            return messagebox.showerror("Error", "The queue is empty.")
+        try:
+            per_disk = self.var_jobs_per_disk.get()
+        except:
+            per_disk = 1
+
+        self.batch = BatchQueue(list(self.batch_jobs), per_volume=per_disk)
+        self.batch_reported = False
+        self.refresh_batch_tree()
+        self.log(f"Running {len(self.batch_jobs)} jobs ({max(1, per_disk)} per disk)...")
+        threading.Thread(target=self.batch.run, daemon=True).start()
+        self.schedule_batch_poll(self.batch)
+
+    def schedule_batch_poll(self, batch, delay=200):
+        # Only one poll loop at a time, however often the view is reopened
+        if self.batch_poll_id is not None:
+            self.after_cancel(self.batch_poll_id)
+        self.batch_poll_id = self.after(delay, self.poll_batch, batch)
+
+    def poll_batch(self, batch):
+        self.batch_poll_id = None
+        if batch is not self.batch:
+            return
+        # Worker threads never touch Tk; all widget updates happen here.
+        # While another view is open only the finish is watched for.
+        visible = self.batch_tree.winfo_exists()
+        if visible:
+            while not batch.messages.empty():
+                self.log(batch.messages.get())
+            for i, res in enumerate(batch.results):
+                self.batch_tree.set(str(i), "S", res["status"])
+                self.batch_tree.set(
+                    str(i), "D", f"{res['renamed']} / {res['skipped']} / {res['errors']}"
+                )
+            if batch.total:
+                self.batch_progress.set(batch.done / batch.total)
+            self.batch_progress_label.configure(text=f"{batch.done} / {batch.total}")
+
+        if not batch.finished:
+            self.schedule_batch_poll(batch)
+            return
+        if self.batch_reported:
+            return
+        self.batch_reported = True
+        renamed = sum(r["renamed"] for r in batch.results)
+        failed = sum(r["status"] == "Failed" for r in batch.results)
+        if visible:
+            self.log(f"Queue finished: {renamed} files renamed, {failed} jobs failed.")
+        messagebox.showinfo(
+            "Done",
+            f"Renamed {renamed} files across {len(batch.results)} jobs"
+            f" ({failed} failed).",
+        )
+
     # --- UTILITY LOGIC ---
     def on_tree_double_click(self, event):
         item_id = self.tree.identify_row(event.y)
@@ -634,34 +1254,27 @@ class RenamerApp(ctk.CTk):
             return
 
         files = sorted([x for x in os.listdir(f) if os.path.isfile(os.path.join(f, x))])
-
-        find, rep = self.util_find.get(), self.util_replace.get()
-        pre, suf = self.util_prefix.get(), self.util_suffix.get()
-        case, num = self.util_case.get(), self.util_num_enable.get()
+        rules = self.get_util_rules()
 
         for i, name in enumerate(files):
             if name in self.manual_overrides:
                 final = self.manual_overrides[name]
                 status = "MANUAL"
             else:
-                r, ext = os.path.splitext(name)
-                new_r = r.replace(find, rep) if find else r
-                if case == "UPPERCASE":
-                    new_r = new_r.upper()
-                elif case == "lowercase":
-                    new_r = new_r.lower()
-                elif case == "Title Case":
-                    new_r = new_r.title()
-
-                new_r = f"{pre}{new_r}{suf}"
-                if num:
-                    new_r += f"_{str(i+1).zfill(3)}"
-
-                final = new_r + ext
-                status = "Ready" if final != name else "No Change"
+                final, status = apply_util_rules(name, i, rules)
 
             self.tree.insert("", "end", values=(name, final, status))
 
+    def get_util_rules(self):
+        return {
+            "find": self.util_find.get(),
+            "replace": self.util_replace.get(),
+            "prefix": self.util_prefix.get(),
+            "suffix": self.util_suffix.get(),
+            "case": self.util_case.get(),
+            "numbering": self.util_num_enable.get(),
+        }
+
     def run_util(self):
         f = self.util_folder_path.get()
         if not f:
@@ -679,6 +1292,168 @@ class RenamerApp(ctk.CTk):
         self.update_preview()
         messagebox.showinfo("Success", f"Renamed {c} files.")
 
+    # --- PROJECT LOGIC ---
+    def current_column_mapping(self):
+        if getattr(self, "combo_folder", None) is not None and self.df is not None:
+            return self.get_column_mapping()
+        return self.column_mapping
+
+    def save_project(self):
+        f = filedialog.asksaveasfilename(
+            defaultextension=".rsproj", filetypes=[("Renamer Project", "*.rsproj")]
+        )
+        if not f:
+            return
+        # Save the header row the loaded sheet was parsed with, if any
+        header_row = self.df_header_row
+        if header_row is None:
+            try:
+                header_row = self.var_header_row.get()
+            except:
+                header_row = 2
+        try:
+            per_disk = self.var_jobs_per_disk.get()
+        except:
+            per_disk = 1
+
+        # The parsed sheet goes in a pickle next to the project so reopening
+        # skips read_excel while the spreadsheet is unchanged
+        excel = self.excel_path.get()
+        sheet = None
+        if self.df is not None and self.df_path == excel and os.path.isfile(excel):
+            sidecar = os.path.splitext(f)[0] + ".sheet.pkl"
+            try:
+                self.df.to_pickle(sidecar)
+                sheet = {
+                    "file": os.path.basename(sidecar),
+                    "signature": file_signature(excel),
+                    "header_row": self.df_header_row,
+                }
+            except Exception:
+                sheet = None
+
+        project = {
+            "version": PROJECT_VERSION,
+            "smart": {
+                "excel_path": excel,
+                "root_folder_path": self.root_folder_path.get(),
+                "header_row": header_row,
+                "enable_isrc": self.var_enable_isrc.get(),
+                "strict_case": self.var_strict_case.get(),
+                "mapping": self.current_column_mapping(),
+                "sheet": sheet,
+                "listings": self.listings.to_json(),
+            },
+            "utility": {
+                "folder": self.util_folder_path.get(),
+                "rules": self.get_util_rules(),
+                "manual_overrides": self.manual_overrides,
+            },
+            "batch": {
+                "jobs": self.batch_jobs,
+                "jobs_per_disk": per_disk,
+            },
+        }
+        try:
+            with open(f, "w", encoding="utf-8") as fh:
+                json.dump(project, fh)
+        except Exception as e:
+            return messagebox.showerror("Error", f"Could not save project.\n{e}")
+        messagebox.showinfo("Saved", f"Project saved to:\n{f}")
+
+    def open_project(self):
+        if self.batch is not None and not self.batch.finished:
+            return
+        f = filedialog.askopenfilename(filetypes=[("Renamer Project", "*.rsproj")])
+        if not f:
+            return
+        # Read and check everything before touching any app state
+        try:
+            with open(f, encoding="utf-8") as fh:
+                project = json.load(fh)
+            if project.get("version") != PROJECT_VERSION:
+                raise ValueError(f"Unsupported project version: {project.get('version')}")
+            smart, util, batch = project["smart"], project["utility"], project["batch"]
+            excel = str(smart["excel_path"])
+            root = str(smart["root_folder_path"])
+            header_row = int(smart["header_row"])
+            enable_isrc = bool(smart["enable_isrc"])
+            strict = bool(smart["strict_case"])
+            mapping = dict(smart["mapping"])
+            sheet = smart["sheet"]
+            if sheet is not None:
+                sheet = {
+                    "file": os.path.join(os.path.dirname(f), sheet["file"]),
+                    "signature": list(sheet["signature"]),
+                    "header_row": int(sheet["header_row"]),
+                }
+            listings = ListingCache.from_json(smart["listings"])
+            util_folder = str(util["folder"])
+            rules = {k: util["rules"][k] for k in self.get_util_rules()}
+            overrides = dict(util["manual_overrides"])
+            jobs = [make_job(job) for job in batch["jobs"]]
+            per_disk = int(batch["jobs_per_disk"])
+        except Exception as e:
+            return messagebox.showerror("Error", f"Could not open project.\n{e}")
+
+        # Leave the current view first so its state isn't stashed over the project's
+        self.clear_content()
+
+        self.excel_path.set(excel)
+        self.root_folder_path.set(root)
+        self.var_header_row.set(header_row)
+        self.var_enable_isrc.set(enable_isrc)
+        self.var_strict_case.set(strict)
+        self.column_mapping = mapping
+
+        notes = []
+        self.df, self.df_header_row, self.df_path = None, None, None
+        if excel and os.path.isfile(excel):
+            if (
+                sheet
+                and sheet["header_row"] == header_row
+                and sheet["signature"] == file_signature(excel)
+                and os.path.isfile(sheet["file"])
+            ):
+                try:
+                    self.df = pd.read_pickle(sheet["file"])
+                    notes.append(f"Restored {len(self.df)} rows from project cache.")
+                except Exception:
+                    self.df = None
+            try:
+                if self.df is None:
+                    self.df = read_sheet(excel, header_row)
+                    notes.append(f"Loaded {len(self.df)} rows (Header: {header_row}).")
+                self.df_header_row = header_row
+                self.df_path = excel
+            except Exception as e:
+                notes.append(f"Could not load sheet: {e}")
+        elif excel:
+            notes.append(f"Sheet not found: {excel}")
+
+        self.listings = listings
+
+        self.util_folder_path.set(util_folder)
+        self.util_find.set(rules["find"])
+        self.util_replace.set(rules["replace"])
+        self.util_prefix.set(rules["prefix"])
+        self.util_suffix.set(rules["suffix"])
+        self.util_case.set(rules["case"])
+        self.util_num_enable.set(rules["numbering"])
+        self.manual_overrides = overrides
+
+        self.batch_jobs = jobs
+        self.batch = None
+        self.var_jobs_per_disk.set(per_disk)
+
+        if util_folder and not excel:
+            self.show_util_view()
+        else:
+            self.show_excel_view()
+            self.log(f"Opened project {os.path.basename(f)}.")
+            for note in notes:
+                self.log(note)
+
 
 if __name__ == "__main__":
     app = RenamerApp()